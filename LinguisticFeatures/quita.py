@@ -33,12 +33,100 @@ Miscellaneous indicators
 
 
 # Package import
+import math
 import re
-import pandas as pd
 import numpy as np
-from nltk import pos_tag
-from nltk import regexp_tokenize
-from nltk import FreqDist
+import pandas as pd
+from nltk.tag import PerceptronTagger
+
+# optional Numba backend: JIT-compiles the fused pass over the
+# frequency profile; without it the reductions fall back to numpy
+try:
+    import numba
+except ImportError:
+    numba = None
+
+
+def _profileReductions(freq, rank, tokenNum):
+    """
+    one pass over the frequency profile returning the three reductions
+    getGiniCoef, getRR and getEntropy share: sum(freq * rank),
+    sum(prob^2) and sum(prob * log2(prob))
+    parameter:
+        freq: int array, type frequencies by descending rank
+        rank: int array, ranks 1..V
+        tokenNum: int, token total
+    return:
+        tuple(float, float, float), the three sums
+    """
+    freqRankSum = 0.0
+    probSquareSum = 0.0
+    probLogSum = 0.0
+    for i in range(len(freq)):
+        prob = freq[i] / tokenNum
+        # widen before multiplying: int32 * int32 stays int32 under the
+        # JIT and could wrap before reaching the float64 accumulator
+        freqRankSum += np.int64(freq[i]) * rank[i]
+        probSquareSum += prob * prob
+        probLogSum += prob * math.log2(prob)
+    return freqRankSum, probSquareSum, probLogSum
+
+
+if numba is not None:
+    _profileReductions = numba.njit(cache=True)(_profileReductions)
+else:
+    def _profileReductions(freq, rank, tokenNum):
+        prob = freq / tokenNum
+        # widen one operand so the elementwise products cannot wrap
+        # when freq and rank arrive as int32
+        return (np.sum(freq.astype(np.int64) * rank),
+                np.sum(np.square(prob)), np.sum(prob * np.log2(prob)))
+
+
+# the tagger pickle is loaded once on first use and reused for every
+# tagging call; nltk.pos_tag historically reloaded it per call
+_TAGGER = None
+
+
+def pos_tag(tokenList):
+    """tag a token list with the module's tagger singleton"""
+    global _TAGGER
+    if _TAGGER is None:
+        _TAGGER = PerceptronTagger()
+    return _TAGGER.tag(tokenList)
+
+
+# POS tag sets used by the miscellaneous indicators; membership tests on
+# these replace the per-word pos_tag calls the old predicates made
+VERB_POS = frozenset(('VB', 'VBD', 'VBG', 'VBN', 'VBP', 'VBZ'))
+ADJ_POS = frozenset(('JJ', 'JJR', 'JJS'))
+FUNC_POS = frozenset(('DT', 'CD', 'CC', 'UH', 'EX', 'MD', 'PP', 'PP$',
+                      'WP', 'WP$', 'PDT', 'WDT', 'IN', 'TO', 'WRB'))
+
+# the tags those sets care about, interned to small integer ids with
+# boolean lookup tables, so the verb/adjective filters are numpy
+# gathers over a uint8 array instead of per-element hash lookups; every
+# other tag shares the trailing 'other' id
+POS_LIST = sorted(VERB_POS | ADJ_POS | FUNC_POS)
+POS2ID = {pos: i for i, pos in enumerate(POS_LIST)}
+OTHER_ID = len(POS_LIST)
+IS_VERB = np.zeros(len(POS_LIST) + 1, dtype=bool)
+IS_VERB[[POS2ID[pos] for pos in VERB_POS]] = True
+IS_ADJ = np.zeros(len(POS_LIST) + 1, dtype=bool)
+IS_ADJ[[POS2ID[pos] for pos in ADJ_POS]] = True
+
+# the tokenizer pattern, compiled once instead of per construction by
+# NLTK's regexp_tokenize
+WORD_RE = re.compile(r'\w+')
+
+# cleanText's three substitutions fused into one compiled alternation,
+# so cleaning is a single pass over the text instead of three
+CLEAN_RE = re.compile(r"('m|'s|n't)|[0-9]|(\[.+?\])")
+
+
+def _cleanRepl(match):
+    """bracketed spans become a space, suffixes and digits vanish"""
+    return ' ' if match.group(2) else ''
 
 
 # QuitaText class
@@ -50,20 +138,27 @@ class QuitaText(object):
     """
     def __init__(self, rawText):
         self.text = self.cleanText(rawText)  # clean text
-        self.tokenList = regexp_tokenize(self.text, '\w+')  # tokenize
+        self.tokenList = WORD_RE.findall(self.text)  # tokenize
         self.tokenPOS = self.getTokenPOS(self.tokenList)
         self.tokenNum = len(self.tokenList)  # calculate token number
-        self.typeData = self.getTypeData(self.tokenList)
-        self.typeNum = len(self.typeData)
+        self.posIds = np.fromiter((POS2ID.get(pos, OTHER_ID)
+                                   for pos in self.tokenPOS),
+                                  dtype=np.uint8, count=self.tokenNum)
+        self.getTypeData(self.tokenList)
+        self.typeNum = len(self.types)
+        # lazily-filled caches for the values several indicators share
+        self._curveLen = None
+        self._exactHPoint = None
+        self._hPoint = None
+        self._reductions = None
+        self._activityCounts = None
 
     @staticmethod
     def cleanText(text):
         text = str(text)  # convert into string
         text = text.lower()  # convert to lower case
-        text = re.sub("'m|'s|n't", '', text)  # remove some suffix
-        text = re.sub('[0-9]', '', text)  # remove numbers
-        text = re.sub(r'\[.+?\]', ' ', text)  # remove bracket
-        return text
+        # remove some suffix, numbers and brackets in one pass
+        return CLEAN_RE.sub(_cleanRepl, text)
 
     @staticmethod
     def getTokenPOS(tokenList):
@@ -71,40 +166,30 @@ class QuitaText(object):
         tokenPOS = [i[1] for i in tag_list]
         return tokenPOS
 
-    @staticmethod
-    def isVerb(word):
-        verbPOS = ['VB', 'VBD', 'VBG', 'VBN', 'VBP', 'VBZ']
-        word_pos = pos_tag([word])[0][1]
-        return word_pos in verbPOS
-
-    @staticmethod
-    def isFunctionWord(word):
-        functionWordsPOS = ['DT', 'CD', 'CC', 'UH', 'EX', 'MD', 'PP', 'PP$',
-                            'WP', 'WP$', 'PDT', 'WDT', 'IN', 'TO', 'WRB']
-        return pos_tag([word])[0][1] in functionWordsPOS
-
-    @staticmethod
-    def getTypeData(tokenList):
-        typeData = pd.DataFrame()
-        freqDist = FreqDist(tokenList)
-        typeNum = len(freqDist)
-        typeData['type'] = FreqDist(tokenList).keys()
-        typeData['freq'] = [freqDist[i] for i in typeData['type']]
-        tokenNum = np.sum(typeData['freq'])
-        typeData = typeData.sort_values('freq', ascending=False)
-        typeData.index = range(typeNum)
-        typeData['prob'] = [freq / tokenNum for freq in typeData['freq']]
-        typeData['rank'] = list(range(1, typeNum + 1))
-        typeData['cumProb'] = [np.sum(typeData['prob'][:i]) for i in
-                               range(1, typeNum + 1)]
-        typeData['pos'] = [i[1] for i in pos_tag(typeData['type'])]
-        return typeData
+    def getTypeData(self, tokenList):
+        """
+        build the type distribution as parallel numpy arrays sorted by
+        descending frequency: types, freq, prob, rank, cumProb and pos;
+        one unique pass, one sort and one cumulative sum replace the
+        per-row python loops the old DataFrame build ran
+        """
+        types, freq = np.unique(np.asarray(tokenList), return_counts=True)
+        order = np.argsort(-freq, kind='stable')
+        self.types = types[order]
+        # frequencies fit int32 and the probabilities only feed ratio
+        # indicators, so the narrower dtypes halve the bytes the
+        # memory-bound reductions move per type
+        self.freq = freq[order].astype(np.int32)
+        self.prob = (self.freq / np.sum(self.freq)).astype(np.float32)
+        self.rank = np.arange(1, len(self.types) + 1, dtype=np.int32)
+        self.cumProb = np.cumsum(self.prob, dtype=np.float32)
+        self.pos = np.array([i[1] for i in pos_tag(list(self.types))])
 
     def isExactHPoint(self):
         """whether there is an exact h-point"""
-        freq = np.array(self.typeData['freq'])
-        rank = np.array(self.typeData['rank'])
-        return np.sum(freq == rank) > 0
+        if self._exactHPoint is None:
+            self._exactHPoint = np.sum(self.freq == self.rank) > 0
+        return self._exactHPoint
 
     def getTTR(self):
         """calculate type-token ratio (TTR)"""
@@ -113,24 +198,33 @@ class QuitaText(object):
 
     def getHPoint(self):
         """calculate h-point (h)"""
-        freq = np.array(self.typeData['freq'])
-        rank = np.array(self.typeData['rank'])
+        if self._hPoint is not None:
+            return self._hPoint
+        freq = self.freq
+        rank = self.rank
         if self.isExactHPoint():
             HPoint = np.where(freq == rank)[0][0] + 1
-            return HPoint
         else:
+            # rank is the dense sequence 1..V, so the type ranked k
+            # simply sits at index k - 1
             r1 = np.sum(freq > rank)
-            r2 = np.sum(freq > rank) + 1
-            f1 = freq[np.where(rank == r1)][0]
-            f2 = freq[np.where(rank == r2)][0]
+            r2 = r1 + 1
+            f1 = freq[r1 - 1]
+            f2 = freq[r2 - 1]
             HPoint = (f1 * r2 - f2 * r1) / (r2 - r1 + f1 - f2)
-            return HPoint
+        self._hPoint = HPoint
+        return HPoint
+
+    def _getReductions(self):
+        """the fused frequency-profile reductions, computed on first use"""
+        if self._reductions is None:
+            self._reductions = _profileReductions(self.freq, self.rank,
+                                                  self.tokenNum)
+        return self._reductions
 
     def getEntropy(self):
         """calculate entropy (H)"""
-        prob = np.array(self.typeData['prob'])
-        entropy = np.sum(prob * np.log2(prob))
-        return entropy
+        return self._getReductions()[2]
 
     def getATL(self):
         """calculate average token length (ATL)"""
@@ -139,28 +233,21 @@ class QuitaText(object):
 
     def getVocabRich(self):
         """calculate vocabulary richness (R4)"""
-        cumProb = np.array(self.typeData['cumProb'])
-        rank = np.array(self.typeData['rank'])
+        cumProb = self.cumProb
         if self.isExactHPoint():
             h = self.getHPoint()
-            hCumProb = cumProb[np.where(rank == h)]
-            richness = 1 - (hCumProb - (h ** 2) / (2 * self.tokenNum))
-            return richness[0]
+            hCumProb = cumProb[h - 1]
         else:
             h = self.getHPoint()
             hLeft = int(h)
             hRight = int(h) + 1
-            hCumProbLeft = cumProb[np.where(rank == hLeft)]
-            hCumProbRight = cumProb[np.where(rank == hRight)]
-            hCumProb = np.average([hCumProbLeft, hCumProbRight])
-            richness = 1 - (hCumProb - (h ** 2) / (2 * self.tokenNum))
-            return richness
+            hCumProb = np.average([cumProb[hLeft - 1], cumProb[hRight - 1]])
+        richness = 1 - (hCumProb - (h ** 2) / (2 * self.tokenNum))
+        return richness
 
     def getRR(self):
         """calculate repeat rate (RR)"""
-        prob = np.array(self.typeData['prob'])
-        repeatRate = np.sum(np.square(prob))
-        return repeatRate
+        return self._getReductions()[1]
 
     def getRRmc(self):
         """calculate Relative Repeat Rate of McIntosh (RRmc)"""
@@ -168,53 +255,58 @@ class QuitaText(object):
         relativeRR = (1 - np.sqrt(RR)) / (1 - 1 / np.sqrt(self.typeNum))
         return relativeRR
 
+    def _tcRange(self, lo, hi):
+        """
+        sum the thematic-concentration terms of the types ranked in
+        [lo, hi), skipping function-word types, in one vectorized
+        expression shared by getTC and getSTC
+        """
+        h = self.getHPoint()
+        idx = np.arange(lo, min(hi, self.typeNum))
+        keep = ~np.isin(self.pos[idx], tuple(FUNC_POS))
+        terms = 2 * ((h - self.rank[idx]) * self.freq[idx]) / \
+            (h * (h - 1) * self.freq[0])
+        return np.sum(terms * keep)
+
     def getTC(self):
         """calculate Thematic Concentration (TC)"""
-        h = self.getHPoint()
-        TCList = list()
-        for i in range(int(h) - 1):
-            if not self.isFunctionWord(self.typeData['type'][i]):
-                f1 = self.typeData['freq'][0]
-                freq = self.typeData['freq'][i]
-                rank = self.typeData['rank'][i]
-                TC = 2 * ((h - rank) * freq) / (h * (h - 1) * f1)
-                TCList.append(TC)
-        return np.sum(np.array(TCList))
+        return self._tcRange(0, int(self.getHPoint()) - 1)
 
     def getSTC(self):
         """calculate Secondary Thematic Concentration (STC)"""
-        h = self.getHPoint()
-        TCList = list()
-        for i in range(int(h) - 1, 2 * int(h) - 1):
-            if not self.isFunctionWord(self.typeData['type'][i]):
-                f1 = self.typeData['freq'][0]
-                freq = self.typeData['freq'][i]
-                rank = self.typeData['rank'][i]
-                TC = 2 * ((h - rank) * freq) / (h * (h - 1) * f1)
-                TCList.append(TC)
-        return np.sum(np.array(TCList))
+        h = int(self.getHPoint())
+        return self._tcRange(h - 1, 2 * h - 1)
+
+    def _getActivityCounts(self):
+        """the verb and adjective token counts, computed on first use"""
+        if self._activityCounts is None:
+            self._activityCounts = (
+                int(np.count_nonzero(IS_VERB[self.posIds])),
+                int(np.count_nonzero(IS_ADJ[self.posIds])))
+        return self._activityCounts
 
     def getActivity(self):
         """calculate Activity (Q)"""
-        verbPOS = ['VB', 'VBD', 'VBG', 'VBN', 'VBP', 'VBZ']
-        adjPOS = ['JJ', 'JJR', 'JJS']
-        verbNum = sum([(pos in verbPOS) for pos in self.tokenPOS])
-        adjNum = sum([(pos in adjPOS) for pos in self.tokenPOS])
+        verbNum, adjNum = self._getActivityCounts()
         return verbNum / (verbNum + adjNum)
 
     def getDescriptivity(self):
         """calculate Descriptivity (D)"""
-        return 1 - self.getActivity()
+        verbNum, adjNum = self._getActivityCounts()
+        return adjNum / (verbNum + adjNum)
 
     def getCurveLen(self, typeNum=None):
         """calculate Curve Length (CL)"""
-        euclidLength = 0
         if typeNum is None:
             typeNum = self.typeNum
-        for i in range(typeNum - 1):
-            freq1 = self.typeData['freq'][i]
-            freq2 = self.typeData['freq'][i + 1]
-            euclidLength = euclidLength + ((freq1 - freq2) ** 2 + 1) ** 0.5
+        if typeNum == self.typeNum and self._curveLen is not None:
+            return self._curveLen
+        # widen before squaring: int32 * int32 wraps once an
+        # adjacent-rank frequency gap exceeds 46340
+        diff = np.diff(self.freq[:typeNum].astype(np.int64))
+        euclidLength = np.sum(np.sqrt(diff * diff + 1))
+        if typeNum == self.typeNum:
+            self._curveLen = euclidLength
         return euclidLength
 
     def getCLI(self):
@@ -231,7 +323,7 @@ class QuitaText(object):
 
     def getAdjMod(self):
         """calculate Adjusted Modulus (A)"""
-        f1 = self.typeData['freq'][0]
+        f1 = self.freq[0]
         h = self.getHPoint()
         V = self.typeNum
         N = self.tokenNum
@@ -240,21 +332,20 @@ class QuitaText(object):
 
     def getGiniCoef(self):
         """calculate Gini Coefficient (G)"""
-        freq = np.array(self.typeData['freq'])
-        rank = np.array(self.typeData['rank'])
+        freqRankSum = self._getReductions()[0]
         V = self.typeNum
         N = self.tokenNum
-        giniCoef = (V + 1 - 2 * np.sum(freq * rank) / N) / V
+        giniCoef = (V + 1 - 2 * freqRankSum / N) / V
         return giniCoef
 
     def getHL(self):
         """calculate Hapax Legomenon Percentage (HL)"""
-        hapaxFreq = sum(self.typeData['freq'] == 1)
+        hapaxFreq = np.sum(self.freq == 1)
         return hapaxFreq / self.tokenNum
 
     def getAlpha(self):
         """calculate Writer’s View (α)"""
-        f1 = self.typeData['freq'][0]
+        f1 = self.freq[0]
         h = self.getHPoint()
         V = self.typeNum
         up = (1 - h) * (f1 + V - 2 * h)
@@ -264,34 +355,35 @@ class QuitaText(object):
 
     def getVerbDist(self):
         """calculate Verb Distances (VD)"""
-        verbIndex = np.where([self.isVerb(word) for word in self.tokenList])[0]
-        verbDist = list()
-        for i in range(len(verbIndex) - 1):
-            dist = verbIndex[i + 1] - verbIndex[i]
-            verbDist.append(dist)
-        return np.average(verbDist)
+        verbIndex = np.flatnonzero(IS_VERB[self.posIds])
+        return np.average(np.diff(verbIndex))
+
+
+# output label of every indicator in getQuitaFeature's battery, in
+# order; the old dict assigned 'R' twice (h-point, then the curve
+# length indicator) and the second assignment won, so 'R' stays the
+# curve length indicator here
+QUITA_FEATURES = [
+    ('TTR', 'getTTR'), ('R', 'getCLI'), ('ATL', 'getATL'),
+    ('R4', 'getVocabRich'), ('RR', 'getRR'), ('RRmc', 'getRRmc'),
+    ('TC', 'getTC'), ('STC', 'getSTC'), ('Q', 'getActivity'),
+    ('D', 'getDescriptivity'), ('CL', 'getCurveLen'),
+    ('Lambda', 'getLambda'), ('A', 'getAdjMod'), ('G', 'getGiniCoef'),
+    ('HL', 'getHL'), ('Alpha', 'getAlpha'), ('VD', 'getVerbDist'),
+]
+QUITA_INDEX = [name for name, method in QUITA_FEATURES]
 
 
 def getQuitaFeature(text):
-    """calculate all linguistic features"""
-    features = dict()
+    """
+    calculate all linguistic features
+    parameter:
+        text: str, raw text to analyze
+    return:
+        pd.Series, one value per indicator indexed by its label
+    """
     quitaText = QuitaText(rawText=text)
-    features['TTR'] = [quitaText.getTTR()]
-    features['R'] = [quitaText.getHPoint()]
-    features['ATL'] = [quitaText.getATL()]
-    features['R4'] = [quitaText.getVocabRich()]
-    features['RR'] = [quitaText.getRR()]
-    features['RRmc'] = [quitaText.getRRmc()]
-    features['TC'] = [quitaText.getTC()]
-    features['STC'] = [quitaText.getSTC()]
-    features['Q'] = [quitaText.getActivity()]
-    features['D'] = [quitaText.getDescriptivity()]
-    features['CL'] = [quitaText.getCurveLen()]
-    features['R'] = [quitaText.getCLI()]
-    features['Lambda'] = [quitaText.getLambda()]
-    features['A'] = [quitaText.getAdjMod()]
-    features['G'] = [quitaText.getGiniCoef()]
-    features['HL'] = [quitaText.getHL()]
-    features['Alpha'] = [quitaText.getAlpha()]
-    features['VD'] = [quitaText.getVerbDist()]
-    return features
+    values = np.empty(len(QUITA_FEATURES), dtype=np.float64)
+    for i, (name, method) in enumerate(QUITA_FEATURES):
+        values[i] = getattr(quitaText, method)()
+    return pd.Series(values, index=QUITA_INDEX)